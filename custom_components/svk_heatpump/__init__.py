@@ -3,16 +3,22 @@
 from typing import Dict, Any, List, Union
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, SERVICE_SET_VALUE, SERVICE_REFRESH_ENTITIES, get_unique_id
+from .const import (
+    DOMAIN,
+    SERVICE_SET_VALUE,
+    SERVICE_REFRESH_ENTITIES,
+    get_unique_id,
+    sanitize_host,
+)
 from .coordinator import SVKDataUpdateCoordinator
-from .config_flow import SVKHeatpumpOptionsFlow
+from .config_flow import async_migrate_entry  # noqa: F401
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: tuple[Platform, ...] = (Platform.SENSOR,)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -172,15 +178,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
-async def async_get_options_flow(
-    config_entry: ConfigEntry,
-) -> SVKHeatpumpOptionsFlow:
-    """Create options flow."""
-    return SVKHeatpumpOptionsFlow(config_entry)
-
-
-# Note: Migration is automatically handled by Home Assistant when the config flow is loaded
-# The async_migrate_entry function is defined in config_flow.py and will be called automatically
+# Note: Home Assistant looks up async_migrate_entry on this module. It is defined in
+# config_flow.py next to the schema it migrates and re-exported by the import above.
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -303,6 +302,20 @@ async def _options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
             entry.entry_id
         )
         
+        # Every option is applied live above; only reload when the entities'
+        # host changed or the coordinator has not picked up new credentials
+        needs_reload = (
+            entry.data.get(CONF_HOST) != coordinator.setup_host
+            or entry.data.get(CONF_USERNAME) != coordinator.username
+            or entry.data.get(CONF_PASSWORD) != coordinator.password
+        )
+        if not needs_reload:
+            options_logger.debug(
+                "Connection unchanged, skipping reload for entry %s",
+                entry.entry_id
+            )
+            return
+        
         # Reload the entry to apply all changes
         await hass.config_entries.async_reload(entry.entry_id)
         
@@ -466,7 +479,10 @@ async def async_set_value_service(call: ServiceCall) -> Dict[str, Any]:
                 else entity_id_param
             )
             
-            service_logger.debug("Processing %d entity IDs: %s", len(entity_ids), entity_ids[:5])
+            # Checked once per call; only the summary below is logged at info
+            debug = service_logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                service_logger.debug("Processing %d entity IDs: %s", len(entity_ids), entity_ids[:5])
             
             for entity_id in entity_ids:
                 try:
@@ -489,17 +505,19 @@ async def async_set_value_service(call: ServiceCall) -> Dict[str, Any]:
                     
                     catalog_id = unique_id_part.split("_", 1)[1]
                     
-                    service_logger.debug(
-                        "Writing value %s to entity %s (catalog ID: %s)",
-                        value, entity_id, catalog_id
-                    )
+                    if debug:
+                        service_logger.debug(
+                            "Writing value %s to entity %s (catalog ID: %s)",
+                            value, entity_id, catalog_id
+                        )
                     
                     # Write the value
                     success = await coordinator.async_write_value(catalog_id, value)
                     
                     if success:
                         results["success"].append(entity_id)
-                        service_logger.info("Successfully wrote value to entity %s", entity_id)
+                        if debug:
+                            service_logger.debug("Successfully wrote value to entity %s", entity_id)
                     else:
                         results["failed"].append(entity_id)
                         error_msg = f"Failed to write value to {entity_id}"
@@ -528,7 +546,7 @@ async def async_set_value_service(call: ServiceCall) -> Dict[str, Any]:
                 
                 if success:
                     # Create the entity ID for the result
-                    host_sanitized = coordinator.host.replace(".", "_").replace(":", "_").replace("-", "_")
+                    host_sanitized = sanitize_host(coordinator.host)
                     entity_id = f"{DOMAIN}.{host_sanitized}_{id_param}"
                     results["success"].append(entity_id)
                     service_logger.info(
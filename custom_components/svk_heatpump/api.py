@@ -12,9 +12,20 @@ from typing import Any, Dict, List, Optional, Union
 
 import httpx
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.json import json_loads
 
 from .const import ENDPOINT_READ, ENDPOINT_WRITE, LOGGER
 
+# Keys an item must carry in the list-style JSON formats
+_ITEM_KEYS = frozenset(("id", "value"))
+
+# Headers sent with every request, also when borrowing a shared client
+_REQUEST_HEADERS = {
+    "User-Agent": "HomeAssistant-SVKHeatpump/1.0",
+    "Accept": "application/json, application/xml, text/plain",
+    "Connection": "keep-alive",
+}
+
 # Custom exceptions for better error handling
 class SVKConnectionError(HomeAssistantError):
     """Exception raised for connection errors."""
@@ -46,6 +57,7 @@ class SVKHeatpumpAPI:
         chunk_size: int = 25,
         api_mode: str = "json",
         request_timeout: int = 30,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         """Initialize the API client.
         
@@ -59,6 +71,8 @@ class SVKHeatpumpAPI:
             chunk_size: Number of entities to request in a single batch (default: 25)
             api_mode: API mode to use (json or html) (default: "json")
             request_timeout: Request timeout in seconds (default: 30)
+            client: Shared HTTP client to borrow instead of creating one; ignored
+                with use_ssl, which needs its own verify context (default: None)
         """
         self.host = host
         self.username = username
@@ -74,19 +88,30 @@ class SVKHeatpumpAPI:
         protocol = "https" if use_ssl else "http"
         self.base_url = f"{protocol}://{host}"
         
-        # Set up authentication
+        # Set up authentication and timeouts, applied per request so they
+        # also work on a borrowed client
         self._auth = httpx.DigestAuth(username, password)
+        self._timeout_config = httpx.Timeout(self.timeout, connect=5.0)
         
         # Determine if SSL verification should be used
         self._verify_ssl = self._should_verify_ssl(host)
         
-        # Create persistent client
-        self._client: Optional[httpx.AsyncClient] = None
+        # Persistent client; created lazily unless a shared one is provided.
+        # HTTPS needs the verify context built in _get_client, which a
+        # borrowed client cannot carry, so it always gets an owned client
+        if use_ssl:
+            client = None
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
         
         # Track connection state
         self._last_success_time = None
         self._consecutive_failures = 0
-        self._client_initialized = False
+        self._client_initialized = client is not None
+        
+        # Last JSON body and its parsed values, reused for an identical body
+        self._last_body: Optional[str] = None
+        self._last_values: Dict[str, Any] = {}
 
     def _should_verify_ssl(self, host: str) -> bool:
         """Determine if SSL verification should be used based on host.
@@ -149,13 +174,9 @@ class SVKHeatpumpAPI:
             # Configure client with SSL settings
             client_config = {
                 "auth": self._auth,
-                "timeout": httpx.Timeout(self.timeout, connect=5.0),
+                "timeout": self._timeout_config,
                 "follow_redirects": True,
-                "headers": {
-                    "User-Agent": "HomeAssistant-SVKHeatpump/1.0",
-                    "Accept": "application/json, application/xml, text/plain",
-                    "Connection": "keep-alive",
-                },
+                "headers": _REQUEST_HEADERS,
             }
             
             # Add SSL configuration
@@ -175,9 +196,20 @@ class SVKHeatpumpAPI:
             
         return self._client
 
+    async def __aenter__(self) -> "SVKHeatpumpAPI":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the client on exit, including on cancellation."""
+        await self.async_close()
+
     async def async_close(self) -> None:
-        """Close the HTTP client and clean up resources."""
-        if self._client:
+        """Close the HTTP client and clean up resources.
+
+        A borrowed client is left open for its owner to close.
+        """
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
             self._client_initialized = False
@@ -204,9 +236,10 @@ class SVKHeatpumpAPI:
         url = f"{self.base_url}{ENDPOINT_READ}"
         params = {"ids": ";".join(ids)}
         
-        LOGGER.debug("Reading values for %d entities: %s", len(ids), ids[:5])  # Log first 5 IDs
-        LOGGER.debug("Using chunk_size=%d, api_mode=%s, request_timeout=%d",
-                    self.chunk_size, self.api_mode, self.request_timeout)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Reading values for %d entities: %s", len(ids), ids[:5])  # Log first 5 IDs
+            LOGGER.debug("Using chunk_size=%d, api_mode=%s, request_timeout=%d",
+                        self.chunk_size, self.api_mode, self.request_timeout)
         
         last_exception = None
         start_time = time.time()
@@ -222,15 +255,25 @@ class SVKHeatpumpAPI:
                     await asyncio.sleep(2 ** attempt + jitter)
                 
                 LOGGER.debug("Attempting to read values (attempt %d/%d)", attempt + 1, self.max_retries + 1)
-                response = await client.get(url, params=params)
+                # Redirects and headers are set per request so a borrowed
+                # client behaves like an owned one
+                response = await client.get(
+                    url,
+                    params=params,
+                    auth=self._auth,
+                    timeout=self._timeout_config,
+                    headers=_REQUEST_HEADERS,
+                    follow_redirects=True,
+                )
                 
                 # Log response details for debugging
-                LOGGER.debug(
-                    "Response status: %d, content-type: %s, content-length: %d",
-                    response.status_code,
-                    response.headers.get("content-type", "unknown"),
-                    len(response.content)
-                )
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug(
+                        "Response status: %d, content-type: %s, content-length: %d",
+                        response.status_code,
+                        response.headers.get("content-type", "unknown"),
+                        len(response.content)
+                    )
                 
                 # Handle authentication errors
                 if response.status_code == 401:
@@ -297,6 +340,17 @@ class SVKHeatpumpAPI:
                 LOGGER.error("Response parsing error: %s", ex)
                 break
                 
+            except SVKAuthenticationError as ex:
+                # Raised above on 401; already counted and classified
+                last_exception = ex
+                break
+                
+            except SVKInvalidResponseError as ex:
+                # Raised and logged by the response parsers
+                last_exception = ex
+                self._consecutive_failures += 1
+                break
+                
             except Exception as ex:
                 last_exception = SVKConnectionError(f"Unexpected error: {ex}")
                 self._consecutive_failures += 1
@@ -359,15 +413,25 @@ class SVKHeatpumpAPI:
                     "Attempting to write value (attempt %d/%d): itemno=%s, value=%s",
                     attempt + 1, self.max_retries + 1, itemno, value
                 )
-                response = await client.get(url, params=params)
+                # Redirects and headers are set per request so a borrowed
+                # client behaves like an owned one
+                response = await client.get(
+                    url,
+                    params=params,
+                    auth=self._auth,
+                    timeout=self._timeout_config,
+                    headers=_REQUEST_HEADERS,
+                    follow_redirects=True,
+                )
                 
                 # Log response details for debugging
-                LOGGER.debug(
-                    "Write response status: %d, content-type: %s, content-length: %d",
-                    response.status_code,
-                    response.headers.get("content-type", "unknown"),
-                    len(response.content)
-                )
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug(
+                        "Write response status: %d, content-type: %s, content-length: %d",
+                        response.status_code,
+                        response.headers.get("content-type", "unknown"),
+                        len(response.content)
+                    )
                 
                 # Handle authentication errors
                 if response.status_code == 401:
@@ -384,7 +448,7 @@ class SVKHeatpumpAPI:
                     # Try to parse response to confirm success
                     try:
                         if response.headers.get("content-type", "").startswith("application/json"):
-                            result = response.json()
+                            result = json_loads(response.text)
                             success = result.get("success", True)
                             if not success:
                                 LOGGER.warning("Write operation returned success=false: %s", result)
@@ -451,6 +515,11 @@ class SVKHeatpumpAPI:
                 )
                 break
                 
+            except (SVKAuthenticationError, SVKWriteAccessError) as ex:
+                # Raised above on 401/403; already counted and classified
+                last_exception = ex
+                break
+                
             except Exception as ex:
                 last_exception = SVKConnectionError(f"Unexpected write error: {ex}")
                 self._consecutive_failures += 1
@@ -523,16 +592,25 @@ class SVKHeatpumpAPI:
         """
         content_type = response.headers.get("content-type", "").lower()
         
-        LOGGER.debug(
-            "Parsing response with content-type: %s, length: %d",
-            content_type, len(response.content)
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Parsing response with content-type: %s, length: %d",
+                content_type, len(response.content)
+            )
         
         try:
             # SVK heat pump returns JSON data as text/html, so we need to try JSON parsing first
             # regardless of the content type
             try:
-                return self._parse_json_response(response)
+                # Unchanged payloads are common between polls; compare the
+                # body (decoded once and cached by httpx) before re-parsing
+                body = response.text
+                if body == self._last_body:
+                    LOGGER.debug("Response body unchanged, reusing parsed values")
+                    return self._last_values
+                result = self._parse_json_response(response)
+                self._last_body, self._last_values = body, result
+                return result
             except (json.JSONDecodeError, SVKInvalidResponseError):
                 # If JSON parsing fails, try other formats based on content type
                 if "application/xml" in content_type or "text/xml" in content_type:
@@ -540,6 +618,9 @@ class SVKHeatpumpAPI:
                 else:
                     # Default to text parsing
                     return self._parse_text_response(response)
+        except SVKInvalidResponseError:
+            # Already logged by the format-specific parser
+            raise
         except Exception as ex:
             LOGGER.error(
                 "Failed to parse response (content-type: %s): %s",
@@ -559,47 +640,40 @@ class SVKHeatpumpAPI:
         try:
             # SVK heat pump returns JSON data as text/html, so we need to parse the text
             # content_type might be text/html but contain valid JSON
-            text_content = response.text
-            
-            # Check for malformed SVK JSON format: {obj},{obj},{obj} (missing array brackets)
-            # This is a common issue with SVK heat pumps where they return comma-separated
-            # JSON objects without the outer array brackets
-            if text_content.strip().startswith('{') and not text_content.strip().startswith('['):
-                # Check if it looks like comma-separated JSON objects
-                if '},{ ' in text_content or '},{' in text_content:
-                    # Pre-process by adding array brackets
-                    LOGGER.debug("Detected malformed SVK JSON format, adding array brackets")
-                    text_content = f'[{text_content}]'
+            text_content = response.text.strip()
             
-            # Try to parse as JSON directly first
+            # Home Assistant's orjson-backed loader; its JSONDecodeError
+            # subclasses the stdlib one caught below
             try:
-                data = response.json()
+                data = json_loads(text_content)
             except json.JSONDecodeError:
-                # If that fails, try to parse the text content
-                data = json.loads(text_content)
+                # Check for malformed SVK JSON format: {obj},{obj},{obj} (missing array brackets)
+                # This is a common issue with SVK heat pumps where they return comma-separated
+                # JSON objects without the outer array brackets. Only tried after a failed
+                # parse, since well-formed bodies can contain "},{" as well
+                if not (text_content.startswith('{') and '},{' in text_content):
+                    raise
+                LOGGER.debug("Detected malformed SVK JSON format, adding array brackets")
+                data = json_loads(f'[{text_content}]')
             
             # Handle different JSON response formats
             if isinstance(data, dict):
-                # Format 1: {"id1": "value1", "id2": "value2", ...}
-                if all(isinstance(k, str) for k in data.keys()):
-                    LOGGER.debug("Parsed JSON response with %d key-value pairs", len(data))
-                    return data
-                
                 # Format 2: {"values": [{"id": "id1", "value": "value1"}, ...]}
-                elif "values" in data and isinstance(data["values"], list):
-                    result = {}
-                    for item in data["values"]:
-                        if isinstance(item, dict) and "id" in item and "value" in item:
-                            result[str(item["id"])] = item["value"]
+                # Checked first: JSON object keys are always strings, so this
+                # would otherwise be swallowed by the key-value format
+                values = data.get("values")
+                if isinstance(values, list):
+                    result = self._items_to_values(values)
                     LOGGER.debug("Parsed JSON response with %d values in list format", len(result))
                     return result
+                
+                # Format 1: {"id1": "value1", "id2": "value2", ...}
+                LOGGER.debug("Parsed JSON response with %d key-value pairs", len(data))
+                return data
                     
             elif isinstance(data, list):
                 # Format 3: SVK heat pump format: [{"id": "id1", "name": "name1", "value": "value1"}, ...]
-                result = {}
-                for item in data:
-                    if isinstance(item, dict) and "id" in item and "value" in item:
-                        result[str(item["id"])] = item["value"]
+                result = self._items_to_values(data)
                 LOGGER.debug("Successfully parsed SVK JSON response with %d values in array format", len(result))
                 return result
                     
@@ -613,6 +687,22 @@ class SVKHeatpumpAPI:
             LOGGER.error("Error parsing JSON response: %s", ex)
             raise SVKInvalidResponseError(f"Error parsing JSON response: {ex}")
 
+    @staticmethod
+    def _items_to_values(items: List[Any]) -> Dict[str, Any]:
+        """Map a list of {"id": ..., "value": ...} items to a values dict.
+        
+        Args:
+            items: Decoded JSON items; entries without both keys are skipped
+            
+        Returns:
+            Dictionary mapping entity IDs to their values
+        """
+        return {
+            str(item["id"]): item["value"]
+            for item in items
+            if isinstance(item, dict) and _ITEM_KEYS <= item.keys()
+        }
+
     def _parse_xml_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Parse XML response.
         
@@ -661,7 +751,9 @@ class SVKHeatpumpAPI:
             text = response.text.strip()
             result = {}
             
-            LOGGER.debug("Parsing text response: %s", text[:100])  # Log first 100 chars
+            # %.100s truncates at emission time, so nothing is sliced when
+            # debug logging is off
+            LOGGER.debug("Parsing text response: %.100s", text)
             
             # Try different text formats
             # Format 1: id1=value1;id2=value2;...
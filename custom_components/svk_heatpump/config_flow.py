@@ -1,15 +1,19 @@
 """Config flow for SVK Heatpump integration."""
 
+import asyncio
+import hmac
 import logging
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.httpx_client import get_async_client
 
 from .api import SVKHeatpumpAPI, SVKAuthenticationError, SVKConnectionError, SVKTimeoutError, SVKInvalidResponseError
 from .const import (
@@ -28,6 +32,152 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map API exceptions to config flow error keys
+_ERROR_MAP: Dict[type, str] = {
+    SVKAuthenticationError: "invalid_auth",
+    SVKConnectionError: "cannot_connect",
+    SVKTimeoutError: "timeout",
+    SVKInvalidResponseError: "invalid_response",
+    TimeoutError: "timeout",
+}
+_HANDLED_ERRORS = tuple(_ERROR_MAP)
+
+# Connection tests make a single attempt, so a dead host fails on the first
+# request with its own error key instead of waiting out the retry backoff
+_PROBE_MAX_RETRIES = 0
+_PROBE_REQUEST_TIMEOUT = 10.0
+
+# Backstop for that one request: its timeout plus a margin
+_CONNECTION_TEST_TIMEOUT = _PROBE_REQUEST_TIMEOUT + 5
+
+# Options flow menu entries
+_MENU_OPTIONS = ("connection", "options", "all")
+
+# Static form schemas, shared by every render
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+_REAUTH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+# Read-only option defaults, the base layer of the options form values
+_DEFAULT_OPTIONS = MappingProxyType(
+    {
+        CONF_WRITE_ACCESS: DEFAULT_WRITE_ACCESS,
+        CONF_FETCH_INTERVAL: DEFAULT_FETCH_INTERVAL,
+        CONF_CHUNK_SIZE: DEFAULT_CHUNK_SIZE,
+        CONF_API_MODE: DEFAULT_API_MODE,
+        CONF_REQUEST_TIMEOUT: DEFAULT_REQUEST_TIMEOUT,
+    }
+)
+
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_WRITE_ACCESS, default=DEFAULT_WRITE_ACCESS
+        ): bool,
+        vol.Optional(
+            CONF_FETCH_INTERVAL, default=DEFAULT_FETCH_INTERVAL
+        ): vol.All(int, vol.Range(min=10, max=300)),
+        vol.Optional(
+            CONF_CHUNK_SIZE, default=DEFAULT_CHUNK_SIZE
+        ): vol.All(int, vol.Range(min=5, max=100)),
+        vol.Optional(
+            CONF_API_MODE, default=DEFAULT_API_MODE
+        ): vol.In(["json", "html"]),
+        vol.Optional(
+            CONF_REQUEST_TIMEOUT, default=DEFAULT_REQUEST_TIMEOUT
+        ): vol.All(int, vol.Range(min=5, max=60)),
+    }
+)
+
+
+def _credentials_error(
+    host: Optional[str], username: str, password: str
+) -> Optional[str]:
+    """Return the error key for the first invalid credential field.
+
+    Args:
+        host: Stripped host, or None when the step does not ask for one
+        username: Stripped username
+        password: Password as entered
+
+    Returns:
+        The error key, or None if all fields are valid
+    """
+    if host is not None and not host:
+        return "invalid_host"
+    if not username:
+        return "invalid_username"
+    # isspace() avoids building a stripped copy just to test for blanks
+    if not password or password.isspace():
+        return "invalid_password"
+    return None
+
+
+async def _async_validate_connection(
+    hass: HomeAssistant, host: str, username: str, password: str
+) -> Dict[str, str]:
+    """Test a connection to the heat pump.
+
+    Args:
+        hass: Home Assistant instance, for the shared HTTP client
+        host: Heat pump host
+        username: Username for authentication
+        password: Password for authentication
+
+    Returns:
+        Empty dict on success, otherwise the form errors to show
+    """
+    _LOGGER.debug(
+        "Testing connection for host %s with user %s",
+        host, username
+    )
+    try:
+        # Borrow the shared client so the test reuses pooled connections; the
+        # API sends its redirect and header settings with every request and
+        # builds its own client when use_ssl needs a verify context, so the
+        # probe sees the pump exactly as the coordinator will
+        async with asyncio.timeout(_CONNECTION_TEST_TIMEOUT):
+            async with SVKHeatpumpAPI(
+                host=host,
+                username=username,
+                password=password,
+                timeout=_PROBE_REQUEST_TIMEOUT,
+                max_retries=_PROBE_MAX_RETRIES,
+                client=get_async_client(hass),
+            ) as api:
+                await api.async_test_connection()
+    except _HANDLED_ERRORS as ex:
+        _LOGGER.error(
+            "Connection test failed for host %s: %s",
+            host, ex
+        )
+        return {"base": _ERROR_MAP[type(ex)]}
+    except Exception as ex:  # pragma: no cover
+        # The form already reports the failure; only format the traceback
+        # when debugging
+        _LOGGER.warning(
+            "Unexpected error testing connection to host %s: %s",
+            host, ex, exc_info=_LOGGER.isEnabledFor(logging.DEBUG)
+        )
+        return {"base": "unknown"}
+
+    _LOGGER.info(
+        "Connection test successful for host %s",
+        host
+    )
+    return {}
+
 
 async def async_migrate_entry(
     hass: HomeAssistant, config_entry: config_entries.ConfigEntry
@@ -36,8 +186,8 @@ async def async_migrate_entry(
     if config_entry.version == 1:
         _LOGGER.info("Migrating config entry from version 1 to 2")
         
-        # Extract options from data
-        old_data = dict(config_entry.data)
+        # Read from the stored mapping directly; nothing is mutated in place
+        old_data = config_entry.data
         
         # Create new data with only connection parameters
         new_data = {
@@ -48,8 +198,8 @@ async def async_migrate_entry(
         
         # Create options with all configuration parameters
         options = {
-            CONF_WRITE_ACCESS: old_data.pop(CONF_WRITE_ACCESS, DEFAULT_WRITE_ACCESS),
-            CONF_FETCH_INTERVAL: old_data.pop(CONF_FETCH_INTERVAL, DEFAULT_FETCH_INTERVAL),
+            CONF_WRITE_ACCESS: old_data.get(CONF_WRITE_ACCESS, DEFAULT_WRITE_ACCESS),
+            CONF_FETCH_INTERVAL: old_data.get(CONF_FETCH_INTERVAL, DEFAULT_FETCH_INTERVAL),
             # Add new options with defaults for backward compatibility
             CONF_CHUNK_SIZE: DEFAULT_CHUNK_SIZE,
             CONF_API_MODE: DEFAULT_API_MODE,
@@ -64,9 +214,10 @@ async def async_migrate_entry(
             version=2
         )
         
+        # Never log new_data: it holds the device password in cleartext
         _LOGGER.info(
-            "Migration completed: data=%s, options=%s",
-            new_data,
+            "Migration completed for host %s: options=%s",
+            new_data[CONF_HOST],
             options
         )
         
@@ -79,11 +230,12 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 2
 
     @staticmethod
-    async def async_migrate_entry(
-        hass: HomeAssistant, config_entry: config_entries.ConfigEntry
-    ) -> bool:
-        """Migrate old entry format to new format."""
-        return await async_migrate_entry(hass, config_entry)
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> "SVKHeatpumpOptionsFlow":
+        """Create the options flow."""
+        return SVKHeatpumpOptionsFlow()
 
     def __init__(self) -> None:
         """Initialize the config flow."""
@@ -103,79 +255,26 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
 
         if user_input is not None:
-            self._host = user_input[CONF_HOST]
-            self._username = user_input[CONF_USERNAME]
+            # Normalize once; passwords are kept verbatim
+            self._host = user_input[CONF_HOST].strip()
+            self._username = user_input[CONF_USERNAME].strip()
             self._password = user_input[CONF_PASSWORD]
 
             # Validate input
-            if not self._host.strip():
-                errors["base"] = "invalid_host"
-            elif not self._username.strip():
-                errors["base"] = "invalid_username"
-            elif not self._password.strip():
-                errors["base"] = "invalid_password"
+            if error := _credentials_error(self._host, self._username, self._password):
+                errors["base"] = error
             else:
                 # Validate connection
-                try:
-                    _LOGGER.debug(
-                        "Testing connection for host %s with user %s",
-                        self._host, self._username
-                    )
-                    
-                    api = SVKHeatpumpAPI(
-                        host=self._host,
-                        username=self._username,
-                        password=self._password
-                    )
-                    await api.async_test_connection()
-                    
+                errors = await _async_validate_connection(
+                    self.hass, self._host, self._username, self._password
+                )
+                if not errors:
                     # If connection is successful, proceed to options step
-                    _LOGGER.info(
-                        "Connection test successful for host %s",
-                        self._host
-                    )
                     return await self.async_step_options()
-                    
-                except SVKAuthenticationError as ex:
-                    _LOGGER.error(
-                        "Authentication error during config flow: %s",
-                        ex
-                    )
-                    errors["base"] = "invalid_auth"
-                except SVKConnectionError as ex:
-                    _LOGGER.error(
-                        "Connection error during config flow: %s",
-                        ex
-                    )
-                    errors["base"] = "cannot_connect"
-                except SVKTimeoutError as ex:
-                    _LOGGER.error(
-                        "Timeout error during config flow: %s",
-                        ex
-                    )
-                    errors["base"] = "timeout"
-                except SVKInvalidResponseError as ex:
-                    _LOGGER.error(
-                        "Invalid response during config flow: %s",
-                        ex
-                    )
-                    errors["base"] = "invalid_response"
-                except Exception as ex:  # pragma: no cover
-                    _LOGGER.error(
-                        "Unexpected error during config flow: %s",
-                        ex, exc_info=True
-                    )
-                    errors["base"] = "unknown"
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): str,
-                    vol.Required(CONF_USERNAME): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -184,48 +283,13 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the options step."""
         if user_input is not None:
-            # Validate options
-            fetch_interval = user_input.get(CONF_FETCH_INTERVAL, DEFAULT_FETCH_INTERVAL)
-            chunk_size = user_input.get(CONF_CHUNK_SIZE, DEFAULT_CHUNK_SIZE)
-            api_mode = user_input.get(CONF_API_MODE, DEFAULT_API_MODE)
-            request_timeout = user_input.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
-            
-            # Validate fetch interval
-            if not isinstance(fetch_interval, int) or fetch_interval < 10 or fetch_interval > 300:
-                errors = {"base": "invalid_fetch_interval"}
-            # Validate chunk size
-            elif not isinstance(chunk_size, int) or chunk_size < 5 or chunk_size > 100:
-                errors = {"base": "invalid_chunk_size"}
-            # Validate request timeout
-            elif not isinstance(request_timeout, int) or request_timeout < 5 or request_timeout > 60:
-                errors = {"base": "invalid_request_timeout"}
-            else:
-                errors = {}
-            
-            if errors:
-                return self.async_show_form(
-                    step_id="options",
-                    data_schema=vol.Schema(
-                        {
-                            vol.Optional(
-                                CONF_WRITE_ACCESS, default=DEFAULT_WRITE_ACCESS
-                            ): bool,
-                            vol.Optional(
-                                CONF_FETCH_INTERVAL, default=DEFAULT_FETCH_INTERVAL
-                            ): vol.All(int, vol.Range(min=10, max=300)),
-                            vol.Optional(
-                                CONF_CHUNK_SIZE, default=DEFAULT_CHUNK_SIZE
-                            ): vol.All(int, vol.Range(min=5, max=100)),
-                            vol.Optional(
-                                CONF_API_MODE, default=DEFAULT_API_MODE
-                            ): vol.In(["json", "html"]),
-                            vol.Optional(
-                                CONF_REQUEST_TIMEOUT, default=DEFAULT_REQUEST_TIMEOUT
-                            ): vol.All(int, vol.Range(min=5, max=60)),
-                        }
-                    ),
-                    errors=errors,
-                )
+            # _OPTIONS_SCHEMA has already type- and range-checked every field
+            # and filled in defaults for omitted ones
+            write_access = user_input[CONF_WRITE_ACCESS]
+            fetch_interval = user_input[CONF_FETCH_INTERVAL]
+            chunk_size = user_input[CONF_CHUNK_SIZE]
+            api_mode = user_input[CONF_API_MODE]
+            request_timeout = user_input[CONF_REQUEST_TIMEOUT]
             
             try:
                 # Create the config entry with core connection data only
@@ -233,7 +297,7 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.info(
                     "Creating config entry for host %s with write_access=%s, fetch_interval=%d, chunk_size=%d, api_mode=%s, request_timeout=%d",
                     self._host,
-                    user_input[CONF_WRITE_ACCESS],
+                    write_access,
                     fetch_interval,
                     chunk_size,
                     api_mode,
@@ -248,7 +312,7 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_PASSWORD: self._password,
                     },
                     options={
-                        CONF_WRITE_ACCESS: user_input[CONF_WRITE_ACCESS],
+                        CONF_WRITE_ACCESS: write_access,
                         CONF_FETCH_INTERVAL: fetch_interval,
                         CONF_CHUNK_SIZE: chunk_size,
                         CONF_API_MODE: api_mode,
@@ -260,51 +324,18 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "Error creating config entry: %s",
                     ex, exc_info=True
                 )
-                return self.async_show_form(
-                    step_id="options",
-                    data_schema=vol.Schema(
-                        {
-                            vol.Optional(
-                                CONF_WRITE_ACCESS, default=DEFAULT_WRITE_ACCESS
-                            ): bool,
-                            vol.Optional(
-                                CONF_FETCH_INTERVAL, default=DEFAULT_FETCH_INTERVAL
-                            ): vol.All(int, vol.Range(min=10, max=300)),
-                            vol.Optional(
-                                CONF_CHUNK_SIZE, default=DEFAULT_CHUNK_SIZE
-                            ): vol.All(int, vol.Range(min=5, max=100)),
-                            vol.Optional(
-                                CONF_API_MODE, default=DEFAULT_API_MODE
-                            ): vol.In(["json", "html"]),
-                            vol.Optional(
-                                CONF_REQUEST_TIMEOUT, default=DEFAULT_REQUEST_TIMEOUT
-                            ): vol.All(int, vol.Range(min=5, max=60)),
-                        }
-                    ),
-                    errors={"base": "unknown"},
-                )
+                return self._show_options_form({"base": "unknown"})
+
+        return self._show_options_form()
 
+    def _show_options_form(
+        self, errors: Optional[Dict[str, str]] = None
+    ) -> FlowResult:
+        """Show the options form of the initial setup."""
         return self.async_show_form(
             step_id="options",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_WRITE_ACCESS, default=DEFAULT_WRITE_ACCESS
-                    ): bool,
-                    vol.Optional(
-                        CONF_FETCH_INTERVAL, default=DEFAULT_FETCH_INTERVAL
-                    ): vol.All(int, vol.Range(min=10, max=300)),
-                    vol.Optional(
-                        CONF_CHUNK_SIZE, default=DEFAULT_CHUNK_SIZE
-                    ): vol.All(int, vol.Range(min=5, max=100)),
-                    vol.Optional(
-                        CONF_API_MODE, default=DEFAULT_API_MODE
-                    ): vol.In(["json", "html"]),
-                    vol.Optional(
-                        CONF_REQUEST_TIMEOUT, default=DEFAULT_REQUEST_TIMEOUT
-                    ): vol.All(int, vol.Range(min=5, max=60)),
-                }
-            ),
+            data_schema=_OPTIONS_SCHEMA,
+            errors=errors,
         )
 
     async def async_step_reauth(
@@ -313,116 +344,89 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle reauthentication step."""
         self._reauth = True
         
-        # Get existing config entry to preserve host
-        if self.context.get("entry_id"):
-            entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
-            if entry:
-                self._host = entry.data.get(CONF_HOST)
-                _LOGGER.info(
-                    "Starting reauth flow for host %s",
-                    self._host
-                )
+        # Get existing config entry to preserve host; reused on success below
+        entry_id = self.context.get("entry_id")
+        entry = (
+            self.hass.config_entries.async_get_entry(entry_id) if entry_id else None
+        )
+        if entry:
+            self._host = entry.data.get(CONF_HOST)
+            _LOGGER.info(
+                "Starting reauth flow for host %s",
+                self._host
+            )
         
         errors: Dict[str, str] = {}
 
         if user_input is not None:
-            self._username = user_input[CONF_USERNAME]
+            self._username = user_input[CONF_USERNAME].strip()
             self._password = user_input[CONF_PASSWORD]
 
-            # Validate input
-            if not self._username.strip():
-                errors["base"] = "invalid_username"
-            elif not self._password.strip():
-                errors["base"] = "invalid_password"
+            # Validate input; the host is kept from the entry
+            if error := _credentials_error(None, self._username, self._password):
+                errors["base"] = error
             else:
                 # Validate connection with new credentials
-                try:
-                    _LOGGER.debug(
-                        "Testing reauth connection for host %s with user %s",
-                        self._host, self._username
-                    )
-                    
-                    api = SVKHeatpumpAPI(
-                        host=self._host,
-                        username=self._username,
-                        password=self._password
-                    )
-                    await api.async_test_connection()
-                    
+                errors = await _async_validate_connection(
+                    self.hass, self._host, self._username, self._password
+                )
+                if not errors:
                     # Update the existing entry with new credentials
-                    if self.context.get("entry_id"):
-                        entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
-                        if entry:
-                            data = dict(entry.data)
-                            data[CONF_USERNAME] = self._username
-                            data[CONF_PASSWORD] = self._password
+                    if entry:
+                        # Reauth starts with the stored credentials, so a
+                        # re-typed identical pair needs no entry or client update;
+                        # the password is compared in constant time
+                        unchanged = self._username == entry.data.get(
+                            CONF_USERNAME
+                        ) and hmac.compare_digest(
+                            (self._password or "").encode(),
+                            # A migrated entry can hold a None password
+                            (entry.data.get(CONF_PASSWORD) or "").encode(),
+                        )
+                        
+                        if not unchanged:
+                            data = entry.data | {
+                                CONF_USERNAME: self._username,
+                                CONF_PASSWORD: self._password,
+                            }
                             
                             self.hass.config_entries.async_update_entry(
                                 entry, data=data
                             )
                             
-                            # Update coordinator credentials if it exists
-                            if DOMAIN in self.hass.data:
-                                coordinator = self.hass.data[DOMAIN].get(entry.entry_id)
-                                if coordinator:
-                                    _LOGGER.info(
-                                        "Updating coordinator credentials for entry %s",
-                                        entry.entry_id
-                                    )
-                                    # Use the async_update_connection method for consistency
-                                    await coordinator.async_update_connection({
+                        # Update coordinator credentials if it exists
+                        if (domain_data := self.hass.data.get(DOMAIN)) and (
+                            coordinator := domain_data.get(entry.entry_id)
+                        ):
+                            if not unchanged:
+                                _LOGGER.info(
+                                    "Updating coordinator credentials for entry %s",
+                                    entry.entry_id
+                                )
+                                # The credentials were just tested, so skip the re-probe
+                                await coordinator.async_update_connection(
+                                    {
                                         CONF_HOST: coordinator.host,
                                         CONF_USERNAME: self._username,
                                         CONF_PASSWORD: self._password,
-                                    })
-                                    # Mark reauth as complete
-                                    coordinator.set_reauth_complete()
+                                    },
+                                    test_connection=False,
+                                )
+                            # Mark reauth as complete and fetch right away; the
+                            # entry is not reloaded, so nothing else would
+                            # refresh the now-unavailable entities
+                            coordinator.set_reauth_complete()
+                            await coordinator.async_request_refresh()
                     
                     _LOGGER.info(
                         "Reauthentication successful for host %s",
                         self._host
                     )
                     return self.async_abort(reason="reauth_successful")
-                    
-                except SVKAuthenticationError as ex:
-                    _LOGGER.error(
-                        "Authentication error during reauth: %s",
-                        ex
-                    )
-                    errors["base"] = "invalid_auth"
-                except SVKConnectionError as ex:
-                    _LOGGER.error(
-                        "Connection error during reauth: %s",
-                        ex
-                    )
-                    errors["base"] = "cannot_connect"
-                except SVKTimeoutError as ex:
-                    _LOGGER.error(
-                        "Timeout error during reauth: %s",
-                        ex
-                    )
-                    errors["base"] = "timeout"
-                except SVKInvalidResponseError as ex:
-                    _LOGGER.error(
-                        "Invalid response during reauth: %s",
-                        ex
-                    )
-                    errors["base"] = "invalid_response"
-                except Exception as ex:  # pragma: no cover
-                    _LOGGER.error(
-                        "Unexpected error during reauth: %s",
-                        ex, exc_info=True
-                    )
-                    errors["base"] = "unknown"
 
         return self.async_show_form(
             step_id="reauth",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_USERNAME): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
-            ),
+            data_schema=_REAUTH_SCHEMA,
             errors=errors,
         )
 
@@ -435,103 +439,46 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not reconfigure_entry:
             return self.async_abort(reason="cannot_reconfigure")
             
-        # Get current values from the entry
-        current_host = reconfigure_entry.data.get(CONF_HOST, "")
-        current_username = reconfigure_entry.data.get(CONF_USERNAME, "")
-        current_password = reconfigure_entry.data.get(CONF_PASSWORD, "")
-        
         errors: Dict[str, str] = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST]
-            username = user_input[CONF_USERNAME]
+            host = user_input[CONF_HOST].strip()
+            username = user_input[CONF_USERNAME].strip()
             password = user_input[CONF_PASSWORD]
 
             # Validate input
-            if not host.strip():
-                errors["base"] = "invalid_host"
-            elif not username.strip():
-                errors["base"] = "invalid_username"
-            elif not password.strip():
-                errors["base"] = "invalid_password"
+            if error := _credentials_error(host, username, password):
+                errors["base"] = error
             else:
                 # Validate connection with new settings
-                try:
-                    _LOGGER.debug(
-                        "Testing reconfigure connection for host %s with user %s",
-                        host, username
-                    )
-                    
-                    api = SVKHeatpumpAPI(
-                        host=host,
-                        username=username,
-                        password=password
-                    )
-                    await api.async_test_connection()
-                    
-                    # If connection is successful, update the entry
-                    _LOGGER.info(
-                        "Reconfigure connection test successful for host %s",
-                        host
-                    )
-                    
+                errors = await _async_validate_connection(
+                    self.hass, host, username, password
+                )
+                if not errors:
                     # Update entry data with new connection settings
-                    new_data = dict(reconfigure_entry.data)
-                    new_data.update({
+                    new_data = reconfigure_entry.data | {
                         CONF_HOST: host,
                         CONF_USERNAME: username,
                         CONF_PASSWORD: password,
-                    })
-                    
-                    # Update the entry and reload it
-                    await self.hass.config_entries.async_update_reload_and_abort(
-                        reconfigure_entry, data=new_data
-                    )
+                    }
                     
                     _LOGGER.info(
                         "Reconfiguration successful for entry %s",
                         reconfigure_entry.entry_id
                     )
                     
-                except SVKAuthenticationError as ex:
-                    _LOGGER.error(
-                        "Authentication error during reconfigure: %s",
-                        ex
-                    )
-                    errors["base"] = "invalid_auth"
-                except SVKConnectionError as ex:
-                    _LOGGER.error(
-                        "Connection error during reconfigure: %s",
-                        ex
+                    # Update the entry, reload it and finish the flow
+                    return self.async_update_reload_and_abort(
+                        reconfigure_entry,
+                        data=new_data,
+                        reason="reconfigure_successful",
                     )
-                    errors["base"] = "cannot_connect"
-                except SVKTimeoutError as ex:
-                    _LOGGER.error(
-                        "Timeout error during reconfigure: %s",
-                        ex
-                    )
-                    errors["base"] = "timeout"
-                except SVKInvalidResponseError as ex:
-                    _LOGGER.error(
-                        "Invalid response during reconfigure: %s",
-                        ex
-                    )
-                    errors["base"] = "invalid_response"
-                except Exception as ex:  # pragma: no cover
-                    _LOGGER.error(
-                        "Unexpected error during reconfigure: %s",
-                        ex, exc_info=True
-                    )
-                    errors["base"] = "unknown"
 
         return self.async_show_form(
             step_id="reconfigure",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST, default=current_host): str,
-                    vol.Required(CONF_USERNAME, default=current_username): str,
-                    vol.Required(CONF_PASSWORD, default=current_password): str,
-                }
+            # Pre-fill the shared user schema with the entry's current values
+            data_schema=self.add_suggested_values_to_schema(
+                _USER_SCHEMA, reconfigure_entry.data
             ),
             errors=errors,
         )
@@ -540,40 +487,24 @@ class SVKHeatpumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class SVKHeatpumpOptionsFlow(config_entries.OptionsFlow):
     """Handle enhanced options flow for SVK Heatpump."""
 
-    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
-        """Initialize options flow."""
-        self.config_entry = config_entry
+    def __init__(self) -> None:
+        """Initialize options flow.
+
+        Home Assistant provides self.config_entry from the flow handler.
+        """
         self._connection_data = {}
         self._options_data = {}
-        self._configure_connection = False
-        self._configure_options = False
+        # Set by the "all" menu option to chain the options step after connection
+        self._configure_all = False
 
     async def async_step_init(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle the initial step - menu selection."""
-        if user_input is not None:
-            # Get the selected menu option
-            selected_option = user_input.get("next_step_id")
-            
-            # Determine what to configure based on user selection
-            if selected_option == "connection":
-                self._configure_connection = True
-                self._configure_options = False
-                return await self.async_step_connection()
-            elif selected_option == "options":
-                self._configure_connection = False
-                self._configure_options = True
-                return await self.async_step_options()
-            elif selected_option == "all":
-                self._configure_connection = True
-                self._configure_options = True
-                return await self.async_step_connection()
-
-        # Show menu selection
+        # Home Assistant routes the chosen option straight to its step
         return self.async_show_menu(
             step_id="init",
-            menu_options=["connection", "options", "all"],
+            menu_options=_MENU_OPTIONS,
         )
 
     async def async_step_connection(
@@ -583,32 +514,20 @@ class SVKHeatpumpOptionsFlow(config_entries.OptionsFlow):
         errors: Dict[str, str] = {}
 
         if user_input is not None:
-            # Validate input
+            # Normalize once; passwords are kept verbatim
             host = user_input.get(CONF_HOST, "").strip()
             username = user_input.get(CONF_USERNAME, "").strip()
-            password = user_input.get(CONF_PASSWORD, "").strip()
+            password = user_input.get(CONF_PASSWORD, "")
             
-            if not host:
-                errors["base"] = "invalid_host"
-            elif not username:
-                errors["base"] = "invalid_username"
-            elif not password:
-                errors["base"] = "invalid_password"
+            # Validate input
+            if error := _credentials_error(host, username, password):
+                errors["base"] = error
             else:
                 # Test connection
-                try:
-                    _LOGGER.debug(
-                        "Testing connection for host %s with user %s",
-                        host, username
-                    )
-                    
-                    api = SVKHeatpumpAPI(
-                        host=host,
-                        username=username,
-                        password=password
-                    )
-                    await api.async_test_connection()
-                    
+                errors = await _async_validate_connection(
+                    self.hass, host, username, password
+                )
+                if not errors:
                     # Connection successful, store data
                     self._connection_data = {
                         CONF_HOST: host,
@@ -616,61 +535,23 @@ class SVKHeatpumpOptionsFlow(config_entries.OptionsFlow):
                         CONF_PASSWORD: password,
                     }
                     
-                    _LOGGER.info(
-                        "Connection test successful for host %s",
-                        host
-                    )
-                    
                     # If we also need to configure options, go to options step
-                    if self._configure_options:
+                    if self._configure_all:
                         return await self.async_step_options()
                     else:
                         # Save and exit
                         return await self._save_configuration()
-                        
-                except SVKAuthenticationError as ex:
-                    _LOGGER.error(
-                        "Authentication error during options flow: %s",
-                        ex
-                    )
-                    errors["base"] = "invalid_auth"
-                except SVKConnectionError as ex:
-                    _LOGGER.error(
-                        "Connection error during options flow: %s",
-                        ex
-                    )
-                    errors["base"] = "cannot_connect"
-                except SVKTimeoutError as ex:
-                    _LOGGER.error(
-                        "Timeout error during options flow: %s",
-                        ex
-                    )
-                    errors["base"] = "timeout"
-                except SVKInvalidResponseError as ex:
-                    _LOGGER.error(
-                        "Invalid response during options flow: %s",
-                        ex
-                    )
-                    errors["base"] = "invalid_response"
-                except Exception as ex:  # pragma: no cover
-                    _LOGGER.error(
-                        "Unexpected error during options flow: %s",
-                        ex, exc_info=True
-                    )
-                    errors["base"] = "unknown"
-
-        # Get current values from config entry data
-        current_host = self.config_entry.data.get(CONF_HOST, "")
-        current_username = self.config_entry.data.get(CONF_USERNAME, "")
 
+        # Pre-fill host and username; the password must be re-entered
+        data = self.config_entry.data
         return self.async_show_form(
             step_id="connection",
-            data_schema=vol.Schema(
+            data_schema=self.add_suggested_values_to_schema(
+                _USER_SCHEMA,
                 {
-                    vol.Required(CONF_HOST, default=current_host): str,
-                    vol.Required(CONF_USERNAME, default=current_username): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
+                    CONF_HOST: data.get(CONF_HOST, ""),
+                    CONF_USERNAME: data.get(CONF_USERNAME, ""),
+                },
             ),
             errors=errors,
         )
@@ -679,135 +560,105 @@ class SVKHeatpumpOptionsFlow(config_entries.OptionsFlow):
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle options configuration step."""
-        errors: Dict[str, str] = {}
-
         if user_input is not None:
-            # Validate the options
-            write_access = user_input.get(CONF_WRITE_ACCESS, DEFAULT_WRITE_ACCESS)
-            fetch_interval = user_input.get(CONF_FETCH_INTERVAL, DEFAULT_FETCH_INTERVAL)
-            chunk_size = user_input.get(CONF_CHUNK_SIZE, DEFAULT_CHUNK_SIZE)
-            api_mode = user_input.get(CONF_API_MODE, DEFAULT_API_MODE)
-            request_timeout = user_input.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+            # _OPTIONS_SCHEMA has already type- and range-checked every field
+            # and filled in defaults for omitted ones
+            self._options_data = {
+                key: user_input[key]
+                for key in (
+                    CONF_WRITE_ACCESS,
+                    CONF_FETCH_INTERVAL,
+                    CONF_CHUNK_SIZE,
+                    CONF_API_MODE,
+                    CONF_REQUEST_TIMEOUT,
+                )
+            }
             
-            # Validate fetch interval range
-            if not isinstance(fetch_interval, int) or fetch_interval < 10 or fetch_interval > 300:
-                errors["base"] = "invalid_fetch_interval"
-            # Validate chunk size range
-            elif not isinstance(chunk_size, int) or chunk_size < 5 or chunk_size > 100:
-                errors["base"] = "invalid_chunk_size"
-            # Validate request timeout range
-            elif not isinstance(request_timeout, int) or request_timeout < 5 or request_timeout > 60:
-                errors["base"] = "invalid_request_timeout"
-            else:
-                # Store options data
-                self._options_data = {
-                    CONF_WRITE_ACCESS: write_access,
-                    CONF_FETCH_INTERVAL: fetch_interval,
-                    CONF_CHUNK_SIZE: chunk_size,
-                    CONF_API_MODE: api_mode,
-                    CONF_REQUEST_TIMEOUT: request_timeout,
-                }
-                
-                # Save and exit
-                return await self._save_configuration()
-
-        # Get current values from config entry options, fallback to data for migration
-        current_write_access = self.config_entry.options.get(
-            CONF_WRITE_ACCESS,
-            self.config_entry.data.get(CONF_WRITE_ACCESS, DEFAULT_WRITE_ACCESS)
-        )
-        current_fetch_interval = self.config_entry.options.get(
-            CONF_FETCH_INTERVAL,
-            self.config_entry.data.get(CONF_FETCH_INTERVAL, DEFAULT_FETCH_INTERVAL)
-        )
-        current_chunk_size = self.config_entry.options.get(
-            CONF_CHUNK_SIZE,
-            self.config_entry.data.get(CONF_CHUNK_SIZE, DEFAULT_CHUNK_SIZE)
-        )
-        current_api_mode = self.config_entry.options.get(
-            CONF_API_MODE,
-            self.config_entry.data.get(CONF_API_MODE, DEFAULT_API_MODE)
-        )
-        current_request_timeout = self.config_entry.options.get(
-            CONF_REQUEST_TIMEOUT,
-            self.config_entry.data.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
-        )
+            # Save and exit
+            return await self._save_configuration()
+
+        # Pre-fill current values: options over data (pre-migration) over defaults;
+        # keys outside the schema are ignored by add_suggested_values_to_schema
+        entry = self.config_entry
+        current = {
+            **_DEFAULT_OPTIONS,
+            **entry.data,
+            **entry.options,
+        }
 
         return self.async_show_form(
             step_id="options",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_WRITE_ACCESS, default=current_write_access
-                    ): bool,
-                    vol.Optional(
-                        CONF_FETCH_INTERVAL, default=current_fetch_interval
-                    ): vol.All(int, vol.Range(min=10, max=300)),
-                    vol.Optional(
-                        CONF_CHUNK_SIZE, default=current_chunk_size
-                    ): vol.All(int, vol.Range(min=5, max=100)),
-                    vol.Optional(
-                        CONF_API_MODE, default=current_api_mode
-                    ): vol.In(["json", "html"]),
-                    vol.Optional(
-                        CONF_REQUEST_TIMEOUT, default=current_request_timeout
-                    ): vol.All(int, vol.Range(min=5, max=60)),
-                }
-            ),
-            errors=errors,
+            data_schema=self.add_suggested_values_to_schema(_OPTIONS_SCHEMA, current),
         )
 
     async def async_step_all(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle configuring all settings."""
-        # This is a menu option that routes to connection first
-        self._configure_connection = True
-        self._configure_options = True
+        # Home Assistant routes the "all" menu choice here; start with the
+        # connection step and continue to options afterwards
+        self._configure_all = True
         return await self.async_step_connection()
 
+    def _get_coordinator(self) -> Optional[Any]:
+        """Return the running coordinator for this entry, if any."""
+        if domain_data := self.hass.data.get(DOMAIN):
+            return domain_data.get(self.config_entry.entry_id)
+        return None
+
     async def _save_configuration(self) -> FlowResult:
         """Save the configuration based on what was changed."""
+        # config_entry is a property resolved through the entry registry on
+        # each access; look it up once for the whole save
+        entry = self.config_entry
         try:
             # Update connection data if changed
-            if self._configure_connection and self._connection_data:
-                new_data = dict(self.config_entry.data)
-                new_data.update(self._connection_data)
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry, data=new_data
-                )
-                
-                # Update coordinator with new connection parameters
-                if DOMAIN in self.hass.data:
-                    coordinator = self.hass.data[DOMAIN].get(self.config_entry.entry_id)
-                    if coordinator:
+            if self._connection_data:
+                new_data = entry.data | self._connection_data
+                if new_data != entry.data:
+                    self.hass.config_entries.async_update_entry(
+                        entry, data=new_data
+                    )
+                    
+                    # Update coordinator with new connection parameters
+                    if coordinator := self._get_coordinator():
                         _LOGGER.info(
                             "Updating coordinator connection for entry %s",
-                            self.config_entry.entry_id
+                            entry.entry_id
+                        )
+                        # Tested in async_step_connection; skip the re-probe
+                        await coordinator.async_update_connection(
+                            self._connection_data, test_connection=False
                         )
-                        await coordinator.async_update_connection(self._connection_data)
+                else:
+                    _LOGGER.debug("Connection settings unchanged, skipping update")
             
             # Update options if changed
-            if self._configure_options and self._options_data:
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry, options=self._options_data
-                )
-                
-                # Update coordinator with new options
-                if DOMAIN in self.hass.data:
-                    coordinator = self.hass.data[DOMAIN].get(self.config_entry.entry_id)
-                    if coordinator:
+            if self._options_data:
+                if self._options_data != entry.options:
+                    self.hass.config_entries.async_update_entry(
+                        entry, options=self._options_data
+                    )
+                    
+                    # Update coordinator with new options
+                    if coordinator := self._get_coordinator():
                         _LOGGER.info(
                             "Updating coordinator options for entry %s: %s",
-                            self.config_entry.entry_id, self._options_data
+                            entry.entry_id, self._options_data
                         )
                         await coordinator.async_update_config(self._options_data)
+                else:
+                    _LOGGER.debug("Options unchanged, skipping update")
             
             _LOGGER.info(
                 "Configuration updated successfully for entry %s",
-                self.config_entry.entry_id
+                entry.entry_id
+            )
+            # The flow result becomes the entry's options, so hand back the
+            # current ones; an empty dict would wipe them on finish
+            return self.async_create_entry(
+                title="", data=dict(entry.options)
             )
-            return self.async_create_entry(title="", data={})
             
         except Exception as ex:
             _LOGGER.error(
@@ -815,20 +666,14 @@ class SVKHeatpumpOptionsFlow(config_entries.OptionsFlow):
                 ex, exc_info=True
             )
             
-            # Determine which step to return to based on what was being configured
-            if self._configure_connection and self._configure_options:
-                # If both were being configured, return to connection step
-                return await self.async_step_connection()
-            elif self._configure_connection:
-                # If only connection was being configured, return to connection step
+            # Return to the first step whose data was being saved
+            if self._connection_data:
                 return await self.async_step_connection()
-            elif self._configure_options:
-                # If only options were being configured, return to options step
+            elif self._options_data:
                 return await self.async_step_options()
             else:
-                # Fallback to menu if no configuration flags are set
+                # Fallback to menu if nothing was collected
                 return self.async_show_menu(
                     step_id="init",
-                    menu_options=["connection", "options", "all"],
-                    errors={"base": "save_failed"},
+                    menu_options=_MENU_OPTIONS,
                 )
\ No newline at end of file
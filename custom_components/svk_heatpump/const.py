@@ -1,11 +1,14 @@
 """Constants for SVK Heatpump integration."""
 
+import asyncio
+import functools
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, Union
 
-import aiofiles
+import aiofiles.os
 import voluptuous as vol
 import yaml
 from homeassistant.const import (
@@ -17,6 +20,12 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 
+# Prefer the libyaml C loader; fall back to the pure-Python one without it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 DOMAIN = "svk_heatpump"
 LOGGER = logging.getLogger(__package__)
 
@@ -43,12 +52,13 @@ SERVICE_SET_VALUE = "set_value"
 SERVICE_REFRESH_ENTITIES = "refresh_entities"
 
 # Platform definitions
-PLATFORMS = [Platform.SENSOR]
+PLATFORMS = (Platform.SENSOR,)
 
 # Catalog file path
 CATALOG_FILE_PATH = Path(__file__).parent / "catalog.yaml"
 
-# Configuration schema
+# Configuration schema; shared, do not mutate (kept a plain dict so it can
+# be passed straight to vol.Schema)
 CONFIG_SCHEMA = {
     vol.Required(CONF_HOST): str,
     vol.Required(CONF_USERNAME): str,
@@ -67,7 +77,53 @@ class ValueMap(TypedDict, total=False):
     mapping: Dict[str, str]
 
 
-@dataclass
+def _identity(raw_value: Any) -> Any:
+    """Return the raw value unchanged."""
+    return raw_value
+
+
+def _build_transform(
+    value_map: Optional[Dict[str, str]], precision: int
+) -> Callable[[Any], Any]:
+    """Build the raw-value transformation for one catalog entity.
+    
+    Args:
+        value_map: Mapping of raw values (as strings) to states, if any.
+        precision: Decimal places for numeric values; 0 leaves them as is.
+        
+    Returns:
+        A callable applying the value map, then the precision, like
+        transform_value, with the per-entity checks resolved up front.
+    """
+    if precision > 0:
+        def _round(raw_value: Any) -> Any:
+            try:
+                return round(float(raw_value), precision)
+            except (ValueError, TypeError):
+                # If conversion fails, return the original value
+                return raw_value
+        
+        if not value_map:
+            return _round
+        
+        def _map_or_round(raw_value: Any) -> Any:
+            str_value = str(raw_value)
+            if str_value in value_map:
+                return value_map[str_value]
+            return _round(raw_value)
+        
+        return _map_or_round
+    
+    if value_map:
+        def _map(raw_value: Any) -> Any:
+            return value_map.get(str(raw_value), raw_value)
+        
+        return _map
+    
+    return _identity
+
+
+@dataclass(slots=True)
 class CatalogEntity:
     """Represents a single entity in the catalog."""
     id: str
@@ -82,82 +138,135 @@ class CatalogEntity:
     value_map: Optional[Dict[str, str]] = None
     translation_key: Optional[str] = None
     write_access: bool = False
+    # Raw-value transformation specialised for this entity
+    transform: Callable[[Any], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the value transformation once per entity."""
+        self.transform = _build_transform(self.value_map, self.precision)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CatalogEntity":
         """Create a CatalogEntity from a dictionary."""
+        get = data.get
         return cls(
             id=str(data["id"]),
             key=data["key"],
             enabled=bool(data["enabled"]),
             platform=data["platform"],
-            device_class=data.get("device_class", ""),
-            unit_of_measurement=data.get("unit_of_measurement", ""),
-            state_class=data.get("state_class", ""),
-            icon=data.get("icon", ""),
-            precision=int(data.get("precision", 0)),
-            value_map=data.get("value_map"),
-            translation_key=data.get("translation_key"),
-            write_access=bool(data.get("write_access", False)),
+            device_class=get("device_class", ""),
+            unit_of_measurement=get("unit_of_measurement", ""),
+            state_class=get("state_class", ""),
+            icon=get("icon", ""),
+            precision=int(get("precision", 0)),
+            value_map=get("value_map"),
+            translation_key=get("translation_key"),
+            write_access=bool(get("write_access", False)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Catalog:
     """Represents the complete catalog of entities."""
     sensors: List[CatalogEntity] = field(default_factory=list)
-
-    def get_enabled_entities(self) -> List[CatalogEntity]:
+    # Lookup indexes, filled by from_dict
+    _by_id: Dict[str, CatalogEntity] = field(default_factory=dict, repr=False)
+    _by_key: Dict[str, CatalogEntity] = field(default_factory=dict, repr=False)
+    # Filtered views, fixed once the catalog is loaded; filled by from_dict
+    _enabled: Tuple[CatalogEntity, ...] = field(default=(), repr=False)
+    _writable: Tuple[CatalogEntity, ...] = field(default=(), repr=False)
+
+    def get_enabled_entities(self) -> Tuple[CatalogEntity, ...]:
         """Get all enabled entities from the catalog."""
-        return [entity for entity in self.sensors if entity.enabled]
+        return self._enabled
 
     def get_all_entities(self) -> List[CatalogEntity]:
         """Get all entities from the catalog regardless of enabled status."""
         return self.sensors
 
-    def get_fetchable_entities(self) -> List[CatalogEntity]:
+    def get_fetchable_entities(self) -> Tuple[CatalogEntity, ...]:
         """Get entities that should be actively fetched (both catalog-enabled and user-enabled).
         
         Returns entities that have enabled=True in the catalog, as these are the ones
         that should be polled from the heat pump API.
         """
-        return [entity for entity in self.sensors if entity.enabled]
+        return self._enabled
 
     def get_entity_by_id(self, entity_id: str) -> Optional[CatalogEntity]:
         """Find an entity by its ID."""
-        for entity in self.sensors:
-            if entity.id == entity_id:
-                return entity
-        return None
+        return self._by_id.get(entity_id)
 
     def get_entity_by_key(self, key: str) -> Optional[CatalogEntity]:
         """Find an entity by its key."""
-        for entity in self.sensors:
-            if entity.key == key:
-                return entity
-        return None
+        return self._by_key.get(key)
 
-    def get_writable_entities(self) -> List[CatalogEntity]:
+    def get_writable_entities(self) -> Tuple[CatalogEntity, ...]:
         """Get all entities that support write operations."""
-        return [entity for entity in self.sensors if entity.write_access and entity.enabled]
+        return self._writable
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Catalog":
         """Create a Catalog from a dictionary."""
-        catalog = cls()
+        # Parse sensors in one pass instead of growing the list per entity
+        entity_from_dict = CatalogEntity.from_dict
+        catalog = cls(
+            sensors=[
+                entity_from_dict(sensor_data)
+                for sensor_data in data.get("sensors") or ()
+            ]
+        )
+        
+        # Index by id and key; the first definition wins, as with the
+        # linear scans these indexes replace
+        by_id = catalog._by_id
+        by_key = catalog._by_key
+        for entity in catalog.sensors:
+            if entity.id in by_id:
+                LOGGER.warning("Duplicate catalog id %s (key %s)", entity.id, entity.key)
+            else:
+                by_id[entity.id] = entity
+            if entity.key in by_key:
+                LOGGER.warning("Duplicate catalog key %s (id %s)", entity.key, entity.id)
+            else:
+                by_key[entity.key] = entity
         
-        # Parse sensors
-        if "sensors" in data:
-            for sensor_data in data["sensors"]:
-                entity = CatalogEntity.from_dict(sensor_data)
-                catalog.sensors.append(entity)
+        # Precompute the filtered views served by the getters
+        catalog._enabled = tuple(
+            entity for entity in catalog.sensors if entity.enabled
+        )
+        catalog._writable = tuple(
+            entity for entity in catalog._enabled if entity.write_access
+        )
         
         return catalog
 
 
-async def async_load_catalog() -> Catalog:
+# Parsed catalog shared by all loads, invalidated when the file's mtime changes
+_CATALOG_CACHE: Optional[Catalog] = None
+_CATALOG_MTIME: float = 0.0
+
+
+def _read_catalog_file() -> Any:
+    """Parse catalog.yaml straight from the file handle.
+    
+    Runs in the executor; libyaml reads the file incrementally, so the
+    contents are never held as one intermediate string.
+    
+    Returns:
+        The parsed YAML document.
+    """
+    with open(CATALOG_FILE_PATH, "rb") as file:
+        return yaml.load(file, Loader=_SafeLoader)
+
+
+async def async_load_catalog(hass: Optional[HomeAssistant] = None) -> Catalog:
     """Load the catalog from the YAML file asynchronously.
     
+    The parsed catalog is cached and reused until catalog.yaml is modified.
+    
+    Args:
+        hass: Optional HomeAssistant instance whose executor parses the file.
+        
     Returns:
         Catalog: The loaded catalog.
         
@@ -165,15 +274,28 @@ async def async_load_catalog() -> Catalog:
         FileNotFoundError: If the catalog file is not found.
         yaml.YAMLError: If the catalog file cannot be parsed.
     """
+    global _CATALOG_CACHE, _CATALOG_MTIME
+    
     try:
-        async with aiofiles.open(CATALOG_FILE_PATH, "r", encoding="utf-8") as file:
-            content = await file.read()
-            data = yaml.safe_load(content)
-            if not data:
-                LOGGER.error("Catalog file is empty")
-                return Catalog()
-            
-            return Catalog.from_dict(data)
+        # Reuse the parsed catalog while the file is unchanged
+        mtime = (await aiofiles.os.stat(CATALOG_FILE_PATH)).st_mtime
+        if _CATALOG_CACHE is not None and mtime == _CATALOG_MTIME:
+            return _CATALOG_CACHE
+        
+        # Read and parse off the event loop
+        if hass is not None:
+            data = await hass.async_add_executor_job(_read_catalog_file)
+        else:
+            data = await asyncio.get_running_loop().run_in_executor(
+                None, _read_catalog_file
+            )
+        if not data:
+            LOGGER.error("Catalog file is empty")
+            return Catalog()
+        
+        _CATALOG_CACHE = Catalog.from_dict(data)
+        _CATALOG_MTIME = mtime
+        return _CATALOG_CACHE
     except FileNotFoundError:
         LOGGER.error("Catalog file not found at %s", CATALOG_FILE_PATH)
         raise
@@ -186,7 +308,7 @@ async def load_catalog(hass: Optional[HomeAssistant] = None) -> Catalog:
     """Load the catalog from the YAML file asynchronously.
     
     Args:
-        hass: Optional HomeAssistant instance (kept for compatibility).
+        hass: Optional HomeAssistant instance whose executor parses the file.
         
     Returns:
         Catalog: The loaded catalog.
@@ -195,12 +317,15 @@ async def load_catalog(hass: Optional[HomeAssistant] = None) -> Catalog:
         FileNotFoundError: If the catalog file is not found.
         yaml.YAMLError: If the catalog file cannot be parsed.
     """
-    return await async_load_catalog()
+    return await async_load_catalog(hass)
 
 
 def transform_value(entity: CatalogEntity, raw_value: Union[str, int, float]) -> Any:
     """Transform a raw value according to the entity's configuration.
     
+    Mapped values come from the value map; other numeric values are rounded
+    to the entity's precision. The hot path calls entity.transform directly.
+    
     Args:
         entity: The catalog entity defining the transformation.
         raw_value: The raw value from the heat pump.
@@ -208,24 +333,24 @@ def transform_value(entity: CatalogEntity, raw_value: Union[str, int, float]) ->
     Returns:
         The transformed value.
     """
-    # Convert to string for mapping
-    str_value = str(raw_value)
-    
-    # Apply value mapping if defined
-    if entity.value_map and str_value in entity.value_map:
-        return entity.value_map[str_value]
-    
-    # Apply precision to numeric values
-    if entity.precision > 0:
-        try:
-            numeric_value = float(raw_value)
-            return round(numeric_value, entity.precision)
-        except (ValueError, TypeError):
-            # If conversion fails, return the original value
-            pass
+    return entity.transform(raw_value)
+
+
+# Characters in a host that are not valid in unique IDs, mapped in one pass
+_HOST_TRANS = str.maketrans({".": "_", ":": "_", "-": "_"})
+
+
+@functools.lru_cache(maxsize=32)
+def sanitize_host(host: str) -> str:
+    """Replace the separators in a host with underscores.
     
-    # Return the original value if no transformation applies
-    return raw_value
+    Args:
+        host: The heat pump host/IP.
+        
+    Returns:
+        The host with '.', ':' and '-' replaced by '_'.
+    """
+    return host.translate(_HOST_TRANS)
 
 
 def get_unique_id(host: str, entity_id: str) -> str:
@@ -239,8 +364,7 @@ def get_unique_id(host: str, entity_id: str) -> str:
         A unique ID in the format svk_heatpump-<host>-<entity_id>.
     """
     # Sanitize host to create a valid unique ID
-    sanitized_host = host.replace(".", "_").replace(":", "_").replace("-", "_")
-    return f"{DOMAIN}-{sanitized_host}-{entity_id}"
+    return f"{DOMAIN}-{sanitize_host(host)}-{entity_id}"
 
 
 # Entity categories for better organization
@@ -253,8 +377,8 @@ class EntityCategory:
     MAINTENANCE = "diagnostic"
 
 
-# Default icons for different device classes
-DEFAULT_ICONS = {
+# Default icons for different device classes; read-only
+DEFAULT_ICONS = MappingProxyType({
     "temperature": "mdi:thermometer",
     "humidity": "mdi:water-percent",
     "pressure": "mdi:gauge",
@@ -262,4 +386,4 @@ DEFAULT_ICONS = {
     "energy": "mdi:lightning-bolt",
     "duration": "mdi:clock",
     "enum": "mdi:toggle-switch",
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -4,13 +4,14 @@ import asyncio
 import logging
 import time
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
@@ -36,7 +37,6 @@ from .const import (
     async_load_catalog,
     get_unique_id,
     load_catalog,
-    transform_value,
 )
 from .const import Catalog, CatalogEntity
 
@@ -49,6 +49,17 @@ EXTENDED_BACKOFF = 300  # 5 minutes
 # Maximum retry interval
 MAX_RETRY_INTERVAL = 60  # 1 minute
 
+# Marks an ID missing from a response; None is a valid raw value
+_MISSING = object()
+
+
+class EntityData(NamedTuple):
+    """Polled state of one catalog entity, keyed by unique ID in the coordinator data."""
+    value: Any
+    raw_value: Any
+    entity: CatalogEntity
+    last_updated: float
+
 
 class SVKDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the SVK Heatpump."""
@@ -69,6 +80,9 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
         self.username = config_entry.data[CONF_USERNAME]
         self.password = config_entry.data[CONF_PASSWORD]
         
+        # Entity unique IDs are built from this host, so changing it needs a reload
+        self.setup_host = self.host
+        
         # Get options with defaults from config_entry.options first, then fallback to data for migration
         self.write_access = config_entry.options.get(
             CONF_WRITE_ACCESS,
@@ -91,16 +105,6 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
             config_entry.data.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
         )
 
-        # Initialize API client
-        self.api = SVKHeatpumpAPI(
-            host=self.host,
-            username=self.username,
-            password=self.password,
-            chunk_size=self.chunk_size,
-            api_mode=self.api_mode,
-            request_timeout=self.request_timeout,
-        )
-
         # Catalog will be loaded asynchronously in async_setup
         self.catalog = None
         self.enabled_entities = []
@@ -122,6 +126,21 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=self.fetch_interval),
         )
 
+        # Initialize API client
+        self.api = self._create_api()
+
+    def _create_api(self) -> SVKHeatpumpAPI:
+        """Create an API client on Home Assistant's shared HTTP connection pool."""
+        return SVKHeatpumpAPI(
+            host=self.host,
+            username=self.username,
+            password=self.password,
+            chunk_size=self.chunk_size,
+            api_mode=self.api_mode,
+            request_timeout=self.request_timeout,
+            client=get_async_client(self.hass),
+        )
+
     async def async_load_catalog(self) -> None:
         """Load the catalog asynchronously."""
         try:
@@ -132,7 +151,7 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
             self.catalog = None
             self.enabled_entities = []
 
-    async def _async_update_data(self) -> Dict[str, Any]:
+    async def _async_update_data(self) -> Dict[str, EntityData]:
         """Update data via library.
 
         Returns:
@@ -160,7 +179,7 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("Catalog not available")
                 # Try to reload catalog
                 try:
-                    self.catalog = await async_load_catalog()
+                    self.catalog = await async_load_catalog(self.hass)
                     self.enabled_entities = self.catalog.get_enabled_entities()
                 except Exception as ex:
                     _LOGGER.error("Failed to reload catalog: %s", ex)
@@ -169,20 +188,28 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
             # Get ALL entities from catalog (both enabled and disabled)
             all_entities = self.catalog.get_all_entities()
             
-            # Filter entities based on user-enabled status in entity registry
+            # Filter entities based on user-enabled status in entity registry;
+            # each is kept with its unique ID so the store loop reuses it
             registry = er.async_get(self.hass)
-            enabled_entities = []
+            get_registry_id = registry.async_get_entity_id
+            get_registry_entry = registry.async_get
+            host = self.host
+            to_fetch: List[Tuple[CatalogEntity, str]] = []
+            
+            # Checked once per poll; the per-entity debug calls below run for
+            # every catalog entry and would otherwise be entered each time
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
             
             for entity in all_entities:
                 # Construct the expected entity ID using the same format as in sensor.py
                 # Use get_unique_id to ensure consistency
-                unique_id = get_unique_id(self.host, entity.id)
+                unique_id = get_unique_id(host, entity.id)
                 # Find the entity ID from the unique ID in the registry
-                entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+                entity_id = get_registry_id("sensor", DOMAIN, unique_id)
                 
                 # Check if entity exists in registry and is enabled by user
                 try:
-                    entity_entry = registry.async_get(entity_id) if entity_id else None
+                    entity_entry = get_registry_entry(entity_id) if entity_id else None
                     
                     # Determine if entity should be fetched
                     should_fetch = False
@@ -191,41 +218,44 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
                         # Entity not in registry yet (first setup)
                         # Only fetch if catalog-enabled
                         should_fetch = entity.enabled
-                        _LOGGER.debug(
-                            "Entity %s not in registry, catalog_enabled=%s, will_fetch=%s",
-                            entity_id, entity.enabled, should_fetch
-                        )
+                        if debug:
+                            _LOGGER.debug(
+                                "Entity %s not in registry, catalog_enabled=%s, will_fetch=%s",
+                                entity_id, entity.enabled, should_fetch
+                            )
                     else:
                         # Entity exists in registry
                         if entity_entry.disabled:
                             # User has disabled the entity
                             should_fetch = False
-                            _LOGGER.debug(
-                                "Entity %s is disabled by user, skipping fetch",
-                                entity_id
-                            )
+                            if debug:
+                                _LOGGER.debug(
+                                    "Entity %s is disabled by user, skipping fetch",
+                                    entity_id
+                                )
                         else:
                             # User has enabled the entity (entity_entry.disabled is False)
                             # Fetch if either:
                             # 1. Entity is catalog-enabled (default behavior)
                             # 2. Entity is catalog-disabled but user has explicitly enabled it
                             should_fetch = entity.enabled or entity_entry.disabled_by is None
-                            _LOGGER.debug(
-                                "Entity %s is enabled by user, catalog_enabled=%s, disabled_by=%s, will_fetch=%s",
-                                entity_id, entity.enabled, entity_entry.disabled_by, should_fetch
-                            )
+                            if debug:
+                                _LOGGER.debug(
+                                    "Entity %s is enabled by user, catalog_enabled=%s, disabled_by=%s, will_fetch=%s",
+                                    entity_id, entity.enabled, entity_entry.disabled_by, should_fetch
+                                )
                     
                     if should_fetch:
-                        enabled_entities.append(entity)
+                        to_fetch.append((entity, unique_id))
                         
                 except Exception as ex:
                     _LOGGER.warning("Error checking entity registry status for %s: %s", entity_id, ex)
                     # Include entity if we can't determine status (fail-safe)
                     # But only if it's catalog-enabled
                     if entity.enabled:
-                        enabled_entities.append(entity)
+                        to_fetch.append((entity, unique_id))
             
-            entity_ids = [entity.id for entity in enabled_entities]
+            entity_ids = [entity.id for entity, _ in to_fetch]
             
             if not entity_ids:
                 _LOGGER.warning("No enabled entities found (catalog + user enabled)")
@@ -235,32 +265,31 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
             # Fetch data from API
             raw_data = await self.api.async_read_values(entity_ids)
             
-            # Transform and store data
-            data_dict = {}
-            for entity in enabled_entities:
-                entity_id = entity.id
-                if entity_id in raw_data:
-                    raw_value = raw_data[entity_id]
-                    # Apply value transformation based on catalog definition
-                    transformed_value = transform_value(entity, raw_value)
-                    
-                    # Store with unique ID for Home Assistant
-                    unique_id = get_unique_id(self.host, entity_id)
-                    data_dict[unique_id] = {
-                        "value": transformed_value,
-                        "raw_value": raw_value,
-                        "entity": entity,
-                        "last_updated": self.hass.loop.time(),
-                    }
-                else:
-                    _LOGGER.debug("Entity %s not found in API response", entity_id)
+            # Transform and store data under the unique ID for Home Assistant,
+            # applying each catalog definition's value transformation; every
+            # value comes from the same response, so they share one timestamp
+            now = self.hass.loop.time()
+            get_raw = raw_data.get
+            data_dict = {
+                unique_id: EntityData(
+                    entity.transform(raw_value), raw_value, entity, now
+                )
+                for entity, unique_id in to_fetch
+                if (raw_value := get_raw(entity.id, _MISSING)) is not _MISSING
+            }
+            
+            # Only walk the misses when there are some to report
+            if debug and len(data_dict) < len(to_fetch):
+                for entity, _ in to_fetch:
+                    if entity.id not in raw_data:
+                        _LOGGER.debug("Entity %s not found in API response", entity.id)
             
             # Reset failure counters on success
             self._consecutive_failures = 0
             self._last_failure_time = None
             self._extended_backoff_until = None
             self._connection_state = "connected"
-            self.last_update_success = self.hass.loop.time()
+            self.last_update_success = now
             
             _LOGGER.debug("Successfully updated %d entities", len(data_dict))
             return data_dict
@@ -370,12 +399,13 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
                 
                 # Update local state if write was successful
                 unique_id = get_unique_id(self.host, entity_id)
-                if unique_id in current_data:
+                if (entity_data := current_data.get(unique_id)) is not None:
                     # Apply transformation to the new value
-                    transformed_value = transform_value(entity, value)
-                    current_data[unique_id]["value"] = transformed_value
-                    current_data[unique_id]["raw_value"] = value
-                    current_data[unique_id]["last_updated"] = self.hass.loop.time()
+                    current_data[unique_id] = entity_data._replace(
+                        value=entity.transform(value),
+                        raw_value=value,
+                        last_updated=self.hass.loop.time(),
+                    )
                 
                 # Notify listeners of data change
                 self.async_set_updated_data(current_data)
@@ -477,6 +507,19 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
             self._connection_state = "error"
             raise ConfigEntryNotReady(f"Connection to SVK Heatpump failed: {ex}")
 
+    def _get_entity_data(self, entity_id: str) -> Optional[EntityData]:
+        """Get the stored poll record of an entity with a single lookup.
+
+        Args:
+            entity_id: The entity ID.
+
+        Returns:
+            The record stored by the last poll, or None if not available.
+        """
+        if self.data is None:
+            return None
+        return self.data.get(get_unique_id(self.host, entity_id))
+
     def get_entity_value(self, entity_id: str) -> Optional[Any]:
         """Get the current value of an entity.
 
@@ -486,9 +529,8 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
         Returns:
             The current value, or None if not available.
         """
-        unique_id = get_unique_id(self.host, entity_id)
-        if self.data is not None and unique_id in self.data:
-            return self.data[unique_id]["value"]
+        if (entity_data := self._get_entity_data(entity_id)) is not None:
+            return entity_data.value
         return None
 
     def get_entity_raw_value(self, entity_id: str) -> Optional[Any]:
@@ -500,9 +542,8 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
         Returns:
             The raw value, or None if not available.
         """
-        unique_id = get_unique_id(self.host, entity_id)
-        if self.data is not None and unique_id in self.data:
-            return self.data[unique_id]["raw_value"]
+        if (entity_data := self._get_entity_data(entity_id)) is not None:
+            return entity_data.raw_value
         return None
 
     def get_entity_last_updated(self, entity_id: str) -> Optional[float]:
@@ -514,9 +555,8 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
         Returns:
             The last update time as a timestamp, or None if not available.
         """
-        unique_id = get_unique_id(self.host, entity_id)
-        if self.data is not None and unique_id in self.data:
-            return self.data[unique_id]["last_updated"]
+        if (entity_data := self._get_entity_data(entity_id)) is not None:
+            return entity_data.last_updated
         return None
 
     def get_entity_by_id(self, entity_id: str) -> Optional[CatalogEntity]:
@@ -541,11 +581,11 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
         """
         return self.catalog.get_entity_by_key(key)
 
-    def get_writable_entities(self) -> List[CatalogEntity]:
+    def get_writable_entities(self) -> Tuple[CatalogEntity, ...]:
         """Get all entities that support write operations.
 
         Returns:
-            List of writable catalog entities.
+            Tuple of writable catalog entities.
         """
         return self.catalog.get_writable_entities()
 
@@ -589,14 +629,7 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
                 self.request_timeout = new_request_timeout
                 
                 # Reinitialize API client with new parameters
-                self.api = SVKHeatpumpAPI(
-                    host=self.host,
-                    username=self.username,
-                    password=self.password,
-                    chunk_size=self.chunk_size,
-                    api_mode=self.api_mode,
-                    request_timeout=self.request_timeout,
-                )
+                self.api = self._create_api()
                 _LOGGER.info(
                     "Updated API client: chunk_size=%d->%d, api_mode=%s->%s, request_timeout=%d->%d",
                     old_chunk_size, self.chunk_size,
@@ -630,11 +663,15 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error updating configuration: %s", ex)
             raise HomeAssistantError(f"Failed to update configuration: {ex}")
 
-    async def async_update_connection(self, connection_data: Dict[str, Any]) -> None:
+    async def async_update_connection(
+        self, connection_data: Dict[str, Any], test_connection: bool = True
+    ) -> None:
         """Update connection parameters.
 
         Args:
             connection_data: The new connection parameters.
+            test_connection: Probe the new connection; callers that have just
+                validated the same parameters pass False.
         """
         try:
             # Store old values for logging
@@ -647,11 +684,7 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
             self.password = connection_data.get(CONF_PASSWORD, self.password)
             
             # Reinitialize API client with new connection parameters
-            self.api = SVKHeatpumpAPI(
-                host=self.host,
-                username=self.username,
-                password=self.password,
-            )
+            self.api = self._create_api()
             
             # Reset failure counters when connection is updated
             self._consecutive_failures = 0
@@ -667,13 +700,20 @@ class SVKDataUpdateCoordinator(DataUpdateCoordinator):
                     old_username, self.username,
                 )
             
-            # Test the new connection
-            try:
-                await self.async_test_connection()
-                _LOGGER.info("New connection test successful")
-            except Exception as ex:
-                _LOGGER.warning("New connection test failed: %s", ex)
-                # Don't raise here - let the next update cycle handle it
+            # Test the new connection unless the caller already did
+            if test_connection:
+                try:
+                    await self.async_test_connection()
+                    _LOGGER.info("New connection test successful")
+                except Exception as ex:
+                    _LOGGER.warning("New connection test failed: %s", ex)
+                    # Don't raise here - let the next update cycle handle it
+            
+            # The entry is no longer reloaded for this, so fetch with the new
+            # parameters now instead of waiting for the next scheduled poll;
+            # during reauth the flow refreshes once it has cleared the flag
+            if not self._reauth_in_progress:
+                await self.async_request_refresh()
             
         except Exception as ex:
             _LOGGER.error("Error updating connection parameters: %s", ex)
@@ -37,6 +37,9 @@ class SVKSensor(CoordinatorEntity, SensorEntity):
         self._entity = entity
         self._attr_unique_id = get_unique_id(coordinator.host, entity.id)
         
+        # Last seen registry disabled state; set in async_setup_entry
+        self._was_disabled = False
+        
         # Set entity registry enabled default based on catalog enabled status
         self._attr_entity_registry_enabled_default = entity.enabled
         
@@ -250,8 +253,8 @@ class SVKSensor(CoordinatorEntity, SensorEntity):
             entity_entry = registry.async_get(self.entity_id)
             
             # Check if the entity was just enabled or disabled
-            was_disabled = hasattr(self, '_was_disabled') and self._was_disabled
-            is_disabled = entity_entry and entity_entry.disabled
+            was_disabled = self._was_disabled
+            is_disabled = bool(entity_entry and entity_entry.disabled)
             
             if was_disabled != is_disabled:
                 _LOGGER.info(
@@ -263,8 +266,7 @@ class SVKSensor(CoordinatorEntity, SensorEntity):
                 self._was_disabled = is_disabled
                 
                 # Trigger a refresh of the coordinator to adjust fetching
-                if hasattr(self.coordinator, 'async_refresh_entity_registry_status'):
-                    await self.coordinator.async_refresh_entity_registry_status()
+                await self.coordinator.async_refresh_entity_registry_status()
             
         except Exception as ex:
             _LOGGER.error(
@@ -311,7 +313,7 @@ async def async_setup_entry(
                     # Initialize the disabled status tracking
                     registry = er.async_get(hass)
                     entity_entry = registry.async_get(sensor.entity_id)
-                    sensor._was_disabled = entity_entry and entity_entry.disabled
+                    sensor._was_disabled = bool(entity_entry and entity_entry.disabled)
                     
                     sensors.append(sensor)
                     _LOGGER.debug(